@@ -6,9 +6,11 @@ import dataclasses
 import enum
 import functools
 import io
+import itertools
+import re
 import typing
 from dataclasses import InitVar
-from typing import Iterator, Literal, Optional, Tuple, Union
+from typing import Iterator, List, Literal, Optional, Tuple, Union
 
 import picharsso
 import PIL.Image
@@ -17,7 +19,7 @@ from PIL.Image import Image
 from rich import ansi, measure, style, text
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.measure import Measurement
-from rich.text import Text
+from rich.text import Span, Text
 from term_image import image as term_image
 
 from nbpreview.data import Data
@@ -32,6 +34,8 @@ class Size(typing.NamedTuple):
 
 
 ImageDrawing = Union[ImageDrawingEnum, Literal["block", "character", "braille"]]
+_ESCAPE_SEQUENCE = re.compile(r"(\x1b\[[0-9;]*m)")
+_RESET_FOREGROUND = "\x1b[39m"
 
 
 class Drawing(abc.ABC):
@@ -255,6 +259,91 @@ def render_fallback_text(fallback_text: str) -> Text:
     return rendered_fallback_text
 
 
+def _merge_spans(line: Text) -> Text:
+    """Merge adjacent spans that share the same style.
+
+    Drawings style every character individually, which would otherwise
+    emit a new escape sequence for each character even when the color
+    does not change.
+    """
+    merged_spans: List[Span] = []
+    for span in line.spans:
+        if merged_spans:
+            last_span = merged_spans[-1]
+            if last_span.end == span.start and last_span.style == span.style:
+                merged_spans[-1] = Span(last_span.start, span.end, span.style)
+                continue
+        merged_spans.append(span)
+    line.spans = merged_spans
+    return line
+
+
+def _sets_foreground(sequence: str) -> bool:
+    """Check whether an escape sequence selects a foreground color."""
+    parameters = iter(sequence[2:-1].split(";"))
+    for parameter in parameters:
+        code = int(parameter or 0)
+        if code == 38 or 30 <= code <= 37 or 90 <= code <= 97:
+            return True
+        if code in (48, 58):
+            # Skip the color arguments so they are not read as selectors
+            color_mode = next(parameters, "")
+            argument_count = {"5": 1, "2": 3}.get(color_mode, 0)
+            for _ in range(argument_count):
+                next(parameters, None)
+    return False
+
+
+def _collapse_escape_sequences(drawing: str) -> Iterator[str]:
+    """Drop foreground resets that are followed by the same color.
+
+    picharsso wraps every character in its own color and reset, so
+    consecutive characters of the same color are joined back into a
+    single run before the drawing is decoded. A reset is only dropped
+    when the repeated sequence sets the foreground color again.
+    """
+    active_sequence: Optional[str] = None
+    pending_reset = False
+    tokens = _ESCAPE_SEQUENCE.split(drawing)
+    # Splitting on a captured pattern alternates text and escape sequences
+    for characters, sequence in itertools.zip_longest(
+        tokens[::2], tokens[1::2], fillvalue=""
+    ):
+        if characters:
+            if pending_reset:
+                yield _RESET_FOREGROUND
+                pending_reset = False
+                active_sequence = None
+            yield characters
+        if sequence == _RESET_FOREGROUND:
+            pending_reset = True
+        elif sequence:
+            if (
+                pending_reset
+                and sequence == active_sequence
+                and _sets_foreground(sequence)
+            ):
+                pending_reset = False
+                continue
+            if pending_reset:
+                yield _RESET_FOREGROUND
+                pending_reset = False
+            active_sequence = sequence
+            yield sequence
+    if pending_reset:
+        yield _RESET_FOREGROUND
+
+
+def _decode_drawing(drawing: str) -> Tuple[Text, ...]:
+    """Decode an ansi drawing into lines of text."""
+    decoder = ansi.AnsiDecoder()
+    collapsed_drawing = "".join(_collapse_escape_sequences(drawing))
+    decoded_drawing = tuple(
+        _merge_spans(line) for line in decoder.decode(collapsed_drawing)
+    )
+    return decoded_drawing
+
+
 @functools.lru_cache(maxsize=2**12)
 def _render_block_drawing(
     image: bytes, max_width: int, max_height: int, fallback_text: str
@@ -272,8 +361,7 @@ def _render_block_drawing(
         rendered_unicode_drawing = (render_fallback_text(fallback_text=fallback_text),)
 
     else:
-        decoder = ansi.AnsiDecoder()
-        rendered_unicode_drawing = tuple(decoder.decode(string_image))
+        rendered_unicode_drawing = _decode_drawing(string_image)
 
     return rendered_unicode_drawing
 
@@ -375,8 +463,7 @@ def _render_character_drawing(
     else:
         pil_image.close()
 
-        decoder = ansi.AnsiDecoder()
-        rendered_character_drawing = tuple(decoder.decode(drawing))
+        rendered_character_drawing = _decode_drawing(drawing)
 
     return rendered_character_drawing
 
@@ -492,8 +579,7 @@ def _render_braille_drawing(
         rendered_character_drawing = (render_fallback_text(fallback_text),)
 
     else:
-        decoder = ansi.AnsiDecoder()
-        rendered_character_drawing = tuple(decoder.decode(drawing))
+        rendered_character_drawing = _decode_drawing(drawing)
 
     return rendered_character_drawing
 
@@ -1,5 +1,6 @@
 """Package-wide test fixtures."""
 import contextlib
+import functools
 import io
 import itertools
 import os
@@ -7,28 +8,173 @@ import pathlib
 import re
 import tempfile
 from pathlib import Path
-from typing import Any, Callable, ContextManager, Dict, Iterator, Optional, Union
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Union
 from unittest.mock import Mock
 
 import jinja2
 import nbformat
 import pytest
 from _pytest.config import Config, _PluggyPlugin
+from _pytest.config.argparsing import Parser
 from _pytest.fixtures import FixtureRequest
+from _pytest.nodes import Item
+from _pytest.runner import CallInfo
 from jinja2 import select_autoescape
 from nbformat.notebooknode import NotebookNode
 from pytest_mock import MockerFixture
 from rich import ansi, console, padding, text
 from rich.text import Text
 
+_LINK_ID_PATTERN = re.compile(r"id=[\d.\-]*;")
+_PROJECT_DIR = pathlib.Path(__file__).parent.parent.resolve()
+_EXPECTED_OUTPUT_KEY = pytest.StashKey[str]()
+_RENDERED_OUTPUT_KEY = pytest.StashKey[str]()
+_EXPECTED_OUTPUT_ITEM_KEY = pytest.StashKey[Item]()
+
+
+def pytest_assertrepr_compare(
+    config: Config, op: str, left: Any, right: Any
+) -> Optional[List[str]]:  # pragma: no cover
+    """Point out where rendered outputs first differ.
+
+    Rendered outputs are long runs of escape sequences, so a full diff
+    of them is slow to compute and hard to read. Only the differing
+    line is shown, starting shortly before the first differing column.
+    Run with ``-vv`` to get pytest's full diff instead.
+    """
+    if not (op == "==" and isinstance(left, str) and isinstance(right, str)):
+        return None
+    _stash_rendered_output(config, left=left, right=right)
+    if config.getoption("verbose") > 1:
+        return None
+    if "\x1b" not in left and "\x1b" not in right:
+        return None
+    line_pairs = itertools.zip_longest(
+        left.splitlines(), right.splitlines(), fillvalue=""
+    )
+    for line_number, (left_line, right_line) in enumerate(line_pairs, start=1):
+        if left_line != right_line:
+            column = len(os.path.commonprefix((left_line, right_line)))
+            start = max(column - 20, 0)
+            return [
+                f"rendered outputs differ at line {line_number},"
+                f" column {column + 1}",
+                repr(left_line[start:]),
+                "!=",
+                repr(right_line[start:]),
+            ]
+    return None
+
+
+def _stash_rendered_output(
+    config: Config, left: str, right: str
+) -> None:  # pragma: no cover
+    """Keep the rendered side of a failed comparison to an expected output.
+
+    The comparison is only recorded while a test is using the
+    ``expected_output`` fixture, and only when one of its sides is that
+    expected output.
+    """
+    item = config.stash.get(_EXPECTED_OUTPUT_ITEM_KEY, None)
+    if item is None:
+        return
+    expected_output = item.stash[_EXPECTED_OUTPUT_KEY]
+    if right == expected_output:
+        item.stash[_RENDERED_OUTPUT_KEY] = left
+    elif left == expected_output:
+        item.stash[_RENDERED_OUTPUT_KEY] = right
+
+
+def pytest_addoption(parser: Parser) -> None:
+    """Add an option to rewrite expected outputs from rendered output."""
+    parser.addoption(
+        "--update-expected-outputs",
+        action="store_true",
+        default=False,
+        help="Write the rendered output of failing tests to their expected"
+        " output files.",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(
+    item: Item, call: CallInfo[None]
+) -> Iterator[None]:  # pragma: no cover
+    """Rewrite the expected output of a failing test when requested.
+
+    Only tests that compare a rendered output against the
+    ``expected_output`` fixture are rewritten. The rendered output is
+    captured by ``pytest_assertrepr_compare``, which pytest only calls
+    for rewritten assertions. Templates that use more
+    than the ``tempfile_path`` placeholder, and outputs that contain the
+    project directory, are left for a manual update. The test is still
+    reported as failed, so rerun the suite to confirm the new expected
+    output.
+    """
+    outcome = yield
+    report = outcome.get_result()  # type: ignore[attr-defined]
+    if not (
+        report.failed
+        and call.when == "call"
+        and item.config.getoption("update_expected_outputs")
+    ):
+        return
+    if _EXPECTED_OUTPUT_KEY not in item.stash:
+        return
+    output = item.stash.get(_RENDERED_OUTPUT_KEY, None)
+    if output is None:
+        report.sections.append(
+            (
+                "expected output",
+                f"Did not rewrite the expected output of {item.name}, no failed"
+                " comparison against it was captured. The rendered output is"
+                " captured by assertion rewriting, so run without"
+                " --assert=plain.",
+            )
+        )
+        return
+    env = _expected_output_environment()
+    template_source, _, _ = env.loader.get_source(  # type: ignore[union-attr]
+        env, f"{item.name}.txt"
+    )
+    placeholder_free_source = template_source.replace("{{ tempfile_path }}", "")
+    if (
+        any(delimiter in placeholder_free_source for delimiter in ("{{", "{%", "{#"))
+        or os.fsdecode(_PROJECT_DIR) in output
+    ):
+        report.sections.append(
+            (
+                "expected output",
+                f"Did not rewrite the expected output of {item.name},"
+                " update its template by hand",
+            )
+        )
+        return
+    from tests.util import process_output
+
+    process_output.write_output(
+        _LINK_ID_PATTERN.sub("id=0;", output), test_name=item.name
+    )
+    report.sections.append(
+        ("expected output", f"Rewrote the expected output of {item.name}")
+    )
+
 
 @pytest.fixture
 def tempfile_path() -> Path:
-    """Fixture that returns the tempfile path."""
+    """Fixture that returns the tempfile path.
+
+    Each pytest-xdist worker gets its own path, so workers do not
+    overwrite or delete each other's link files.
+    """
     prefix = tempfile.template
-    file_path = pathlib.Path(tempfile.gettempdir()) / pathlib.Path(
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    file_name = (
         f"{prefix}nbpreview_link_file"
+        if worker_id is None
+        else f"{prefix}nbpreview_link_file_{worker_id}_"
     )
+    file_path = pathlib.Path(tempfile.gettempdir()) / pathlib.Path(file_name)
     return file_path
 
 
@@ -38,8 +184,7 @@ def remove_link_ids() -> Callable[[str], str]:
 
     def _remove_link_ids(render: str) -> str:
         """Remove link ids from rendered hyperlinks."""
-        re_link_ids = re.compile(r"id=[\d\.\-]*?;")
-        subsituted_render = re_link_ids.sub("id=0;", render)
+        subsituted_render = _LINK_ID_PATTERN.sub("id=0;", render)
         return subsituted_render
 
     return _remove_link_ids
@@ -219,15 +364,17 @@ def ansi_right_pad(value: str, min_width: int = 80) -> str:
     return output.getvalue().rstrip("\n")
 
 
-@pytest.fixture
-def expected_output(
-    request: FixtureRequest, tempfile_path: Path, remove_link_ids: Callable[[str], str]
-) -> str:
-    """Get the expected output for a test."""
+@functools.lru_cache(maxsize=1)
+def _expected_output_environment() -> jinja2.Environment:
+    """Create the environment that loads the expected output templates.
+
+    The environment is cached so that each expected output template is
+    only read and compiled once per test session, and only for the
+    tests that request it.
+    """
     output_directory = pathlib.Path(__file__).parent / pathlib.Path(
         "unit", "expected_outputs"
     )
-    test_name = request.node.name
     env = jinja2.Environment(
         loader=jinja2.FileSystemLoader(output_directory),
         autoescape=select_autoescape(),
@@ -235,13 +382,29 @@ def expected_output(
     )
     env.filters["ansi_right_pad"] = ansi_right_pad
     env.filters["ansi_wrap"] = ansi_wrap
+    return env
+
+
+@pytest.fixture
+def expected_output(request: FixtureRequest, tempfile_path: Path) -> Iterator[str]:
+    """Get the expected output for a test.
+
+    The templates are stored with their link ids already removed. While
+    the test runs, the expected output is kept on its node so that a
+    failed comparison against it can be rewritten with
+    ``--update-expected-outputs``.
+    """
+    test_name = request.node.name
+    env = _expected_output_environment()
     expected_output_file = f"{test_name}.txt"
     expected_output_template = env.get_template(expected_output_file)
-    project_dir = pathlib.Path(__file__).parent.parent.resolve()
     expected_output = expected_output_template.render(
-        tempfile_path=os.fsdecode(tempfile_path), project_dir=project_dir
+        tempfile_path=os.fsdecode(tempfile_path), project_dir=_PROJECT_DIR
     )
-    return remove_link_ids(expected_output)
+    request.node.stash[_EXPECTED_OUTPUT_KEY] = expected_output
+    request.config.stash[_EXPECTED_OUTPUT_ITEM_KEY] = request.node
+    yield expected_output
+    del request.config.stash[_EXPECTED_OUTPUT_ITEM_KEY]
 
 
 @pytest.fixture
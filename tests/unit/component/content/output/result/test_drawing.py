@@ -5,6 +5,8 @@ import nbformat
 import PIL.Image
 import pytest
 from PIL.Image import Image
+from rich.style import Style
+from rich.text import Span
 
 from nbpreview.component.content.output.result import drawing
 from nbpreview.data import Data
@@ -265,3 +267,61 @@ def test_get_image_not_str() -> None:
     output = drawing._get_image(data, image_type=image_type)
     expected_output = None
     assert output is expected_output
+
+
+@pytest.mark.parametrize(
+    "ansi_drawing, expected_output",
+    [
+        (
+            "\x1b[38;2;1;2;3m⣿\x1b[39m\x1b[38;2;1;2;3m⣿\x1b[39m"
+            "\x1b[38;2;4;5;6m⣾\x1b[39m\n\x1b[38;2;4;5;6m⣾\x1b[39m",
+            "\x1b[38;2;1;2;3m⣿⣿\x1b[39m\x1b[38;2;4;5;6m⣾\x1b[39m\n"
+            "\x1b[38;2;4;5;6m⣾\x1b[39m",
+        ),
+        (
+            "\x1b[38;2;1;1;1m\x1b[48;2;2;2;2mA\x1b[39m\x1b[48;2;2;2;2mB",
+            "\x1b[38;2;1;1;1m\x1b[48;2;2;2;2mA\x1b[39m\x1b[48;2;2;2;2mB",
+        ),
+        (
+            "\x1b[38;2;9;9;9m\x1b[48;2;138;0;0mA\x1b[39m\x1b[48;2;138;0;0mB",
+            "\x1b[38;2;9;9;9m\x1b[48;2;138;0;0mA\x1b[39m\x1b[48;2;138;0;0mB",
+        ),
+    ],
+    ids=["repeated_foreground", "repeated_background", "background_color_38"],
+)
+def test_collapse_escape_sequences(ansi_drawing: str, expected_output: str) -> None:
+    """It joins consecutive characters of the same foreground color."""
+    output = "".join(drawing._collapse_escape_sequences(ansi_drawing))
+    assert output == expected_output
+
+
+@pytest.mark.parametrize(
+    "sequence, expected_output",
+    [
+        ("\x1b[38;2;1;2;3m", True),
+        ("\x1b[1;31m", True),
+        ("\x1b[94m", True),
+        ("\x1b[48;2;1;2;3;38;5;4m", True),
+        ("\x1b[48;2;138;38;0m", False),
+        ("\x1b[1;48;5;38m", False),
+        ("\x1b[m", False),
+    ],
+)
+def test_sets_foreground(sequence: str, expected_output: bool) -> None:
+    """It only reads color selectors, not color arguments, as foregrounds."""
+    output = drawing._sets_foreground(sequence)
+    assert output is expected_output
+
+
+def test_decode_drawing_merges_color_runs() -> None:
+    """It decodes consecutive characters of the same color as one span."""
+    ansi_drawing = (
+        "\x1b[38;2;1;2;3m⣿\x1b[39m\x1b[38;2;1;2;3m⣿\x1b[39m"
+        "\x1b[38;2;1;2;3;48;2;4;5;6m⣾\x1b[0m\x1b[38;2;1;2;3;48;2;4;5;6m⣾\x1b[0m"
+    )
+    (output,) = drawing._decode_drawing(ansi_drawing)
+    expected_output = [
+        Span(0, 2, Style.parse("#010203")),
+        Span(2, 4, Style.parse("#010203 on #040506")),
+    ]
+    assert output.spans == expected_output
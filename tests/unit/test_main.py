@@ -295,7 +295,6 @@ def cli_arg(
 @pytest.fixture
 def test_cli(
     cli_arg: Callable[..., str],
-    remove_link_ids: Callable[[str], str],
     expected_output: str,
 ) -> Callable[..., None]:
     """Return fixture that tests expected argument output."""
@@ -332,7 +331,7 @@ def test_cli(
             images=images,
             **kwargs,
         )
-        assert output == remove_link_ids(expected_output)
+        assert output == expected_output
 
     return _test_cli
 
@@ -91,11 +91,11 @@ class LinkFilePathNotFoundError(Exception):
 @pytest.fixture
 def parse_link_filepath() -> Callable[[str], Path]:
     """Return a helper function for parsing filepaths from links."""
+    path_re = re.compile(r"(?:file://)([^\x1b]+)(?:\x1b\\\x1b)")
 
     def _parse_link_filepath(output: str) -> Path:
         """Extract the filepaths of hyperlinks in outputs."""
-        path_re = re.compile(r"(?:file://)(.+)(?:\x1b\\\x1b)")
-        link_filepath_match = re.search(path_re, output)
+        link_filepath_match = path_re.search(output)
         if link_filepath_match is not None:
             link_filepath = link_filepath_match.group(1)
             return pathlib.Path(link_filepath)
@@ -204,7 +204,7 @@ def test_automatic_plain(
     assert output == expected_output
 
 
-def test_julia_syntax() -> None:
+def test_julia_syntax(expected_output: str) -> None:
     """It highlights Julia code."""
     julia_notebook = {
         "cells": [
@@ -261,37 +261,12 @@ def test_julia_syntax() -> None:
     rendered_notebook = notebook.Notebook(julia_notebook_node, theme="material")
     con.print(rendered_notebook)
     output = output_file.getvalue()
-    expected_output = (
-        "\x1b[38;2;187;128;179;49mfunction\x1b[0m\x1b[38;2"
-        ";238;255;255;49m \x1b[0m\x1b[38;2;238;255;255;"
-        "49mprintx\x1b[0m\x1b[38;2;137;221;255;49m(\x1b[0m"
-        "\x1b[38;2;238;255;255;49mx\x1b[0m\x1b[38;2;137;22"
-        "1;255;49m)\x1b[0m                          "
-        "                                    \n\x1b[3"
-        "8;2;238;255;255;49m    \x1b[0m\x1b[38;2;238;25"
-        "5;255;49mprintln\x1b[0m\x1b[38;2;137;221;255;4"
-        '9m(\x1b[0m\x1b[38;2;195;232;141;49m"\x1b[0m\x1b[38;2'
-        ";195;232;141;49mx = \x1b[0m\x1b[38;2;137;221;2"
-        '55;49m$x\x1b[0m\x1b[38;2;195;232;141;49m"\x1b[0m\x1b'
-        "[38;2;137;221;255;49m)\x1b[0m              "
-        "                                        "
-        "     \n\x1b[38;2;238;255;255;49m    \x1b[0m\x1b[38"
-        ";2;187;128;179;49mreturn\x1b[0m\x1b[38;2;238;2"
-        "55;255;49m \x1b[0m\x1b[38;2;130;170;255;49mnot"
-        "hing\x1b[0m                                "
-        "                              \n\x1b[38;2;18"
-        "7;128;179;49mend\x1b[0m                    "
-        "                                        "
-        "                 \n                      "
-        "                                        "
-        "                  \nprintx (generic funct"
-        "ion with 1 method)                      "
-        "                   \n"
-    )
     assert output == expected_output
 
 
-def test_notebook_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -300,22 +275,12 @@ def test_notebook_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "### Lorep ipsum\n\n**dolor** _sit_ `amet`",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "                                        "
-        "                                        "
-        "\n  \x1b[1;38;5;37m### \x1b[0m\x1b[1;38;5;37mLorep"
-        " ipsum\x1b[0m\x1b[1;38;5;37m                  "
-        "                                        "
-        "     \x1b[0m\n                              "
-        "                                        "
-        "          \n  \x1b[1mdolor\x1b[0m \x1b[3msit\x1b[0m \x1b"
-        "[97;40mamet\x1b[0m                         "
-        "                                       \n"
-    )
     assert output == expected_output
 
 
-def test_notebook_latex_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_latex_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with latex equations."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -325,31 +290,12 @@ def test_notebook_latex_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "\n\n$$\ny = \\alpha + \\beta x\n$$\n\nsu ro\n",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "                                        "
-        "                                        "
-        "\n  \x1b[1;38;5;37m### \x1b[0m\x1b[1;38;5;37mLorep"
-        " ipsum\x1b[0m\x1b[1;38;5;37m                  "
-        "                                        "
-        "     \x1b[0m\n                              "
-        "                                        "
-        "          \n  Lorep ipsum doret $\\gamma$ "
-        "su                                      "
-        "           \n                            "
-        "                                        "
-        "            \n  y = α+ βx                "
-        "                                        "
-        "             \n                          "
-        "                                        "
-        "              \n  su ro                  "
-        "                                        "
-        "               \n"
-    )
     assert output == expected_output
 
 
 def test_notebook_latex_and_table_markdown_cell(
     rich_notebook_output: RichOutput,
+    expected_output: str,
 ) -> None:
     """It renders a markdown cell with latex equations and tables."""
     source = textwrap.dedent(
@@ -388,59 +334,6 @@ def test_notebook_latex_and_table_markdown_cell(
         "source": source,
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "  \x1b[1;38;5;231;48;5;57m \x1b[0m\x1b[1;38;5;231"
-        ";48;5;57mLorep ipsum\x1b[0m\x1b[1;38;5;231;48;"
-        "5;57m \x1b[0m\x1b[1;38;5;231;48;5;57m         "
-        "                                        "
-        "                \x1b[0m\n  \x1b[2;38;5;57m─────"
-        "────────────────────────────────────────"
-        "─────────────────────────────────\x1b[0m\n  "
-        "                                        "
-        "                                      \n "
-        " Hey                                    "
-        "                                       \n"
-        "                                        "
-        "                                        "
-        "\n   \x1b[1ma\x1b[0m                         \x1b["
-        "1mb\x1b[0m                          \x1b[1mc\x1b["
-        "0m                       \n  ────────────"
-        "────────────────────────────────────────"
-        "──────────────────────────\n   1         "
-        "                2                       "
-        "   3                       \n            "
-        "                                        "
-        "                            \n           "
-        "                                        "
-        "                             \n  X ∼𝒩(μ, "
-        "σ^2)                                    "
-        "                              \n         "
-        "                                        "
-        "                               \n  Hear  "
-        "                                        "
-        "                                \n       "
-        "                                        "
-        "                                 \n   \x1b[1"
-        "ma\x1b[0m                         \x1b[1mb\x1b[0m"
-        "                          \x1b[1mc\x1b[0m     "
-        "                  \n  ───────────────────"
-        "────────────────────────────────────────"
-        "───────────────────\n   1                "
-        "         2                          3   "
-        "                    \n                   "
-        "                                        "
-        "                     \n  Ehse            "
-        "                                        "
-        "                      \n                 "
-        "                                        "
-        "                       \n  rmse = √(( rac"
-        "1n)∑_i=1^n(y_i - x_i)^2)                "
-        "                        \n               "
-        "                                        "
-        "                         \n  Fin         "
-        "                                        "
-        "                          \n"
-    )
     assert output == expected_output
 
 
@@ -605,7 +498,9 @@ def test_image_markdown_cell_no_drawing(
     assert remove_link_ids(output) == remove_link_ids(expected_output)
 
 
-def test_code_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_code_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with code."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -614,28 +509,12 @@ def test_code_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "```python\nfor i in range(20):\n    print(i)\n```",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "  \x1b[38;2;238;255;255;49m    \x1b[0m\x1b[38;2;1"
-        "87;128;179;49mfor\x1b[0m\x1b[38;2;238;255;255;"
-        "49m \x1b[0m\x1b[38;2;238;255;255;49mi\x1b[0m\x1b[38;"
-        "2;238;255;255;49m \x1b[0m\x1b[3;38;2;137;221;2"
-        "55;49min\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;130;170;255;49mrange\x1b[0m\x1b[38;2;137"
-        ";221;255;49m(\x1b[0m\x1b[38;2;247;140;108;49m2"
-        "0\x1b[0m\x1b[38;2;137;221;255;49m)\x1b[0m\x1b[38;2;1"
-        "37;221;255;49m:\x1b[0m                     "
-        "                                  \n  \x1b[3"
-        "8;2;238;255;255;49m        \x1b[0m\x1b[38;2;13"
-        "0;170;255;49mprint\x1b[0m\x1b[38;2;137;221;255"
-        ";49m(\x1b[0m\x1b[38;2;238;255;255;49mi\x1b[0m\x1b[38"
-        ";2;137;221;255;49m)\x1b[0m                 "
-        "                                        "
-        "     \n"
-    )
     assert output == expected_output
 
 
-def test_table_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_table_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with tables."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -669,83 +548,12 @@ rak
      """,
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "  \x1b[1;38;5;231;48;5;57m \x1b[0m\x1b[1;38;5;231"
-        ";48;5;57mHey buddy\x1b[0m\x1b[1;38;5;231;48;5;"
-        "57m \x1b[0m\x1b[1;38;5;231;48;5;57m           "
-        "                                        "
-        "                \x1b[0m\n  \x1b[2;38;5;57m─────"
-        "────────────────────────────────────────"
-        "─────────────────────────────────\x1b[0m\n  "
-        "                                        "
-        "                                      \n "
-        " \x1b[3mdid you hear the news?\x1b[0m         "
-        "                                        "
-        "       \n                                "
-        "                                        "
-        "        \n  \x1b[38;2;238;255;255;49m    \x1b[0"
-        "m\x1b[38;2;187;128;179;49mfor\x1b[0m\x1b[38;2;238"
-        ";255;255;49m \x1b[0m\x1b[38;2;238;255;255;49mi"
-        "\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[3;38;2;"
-        "137;221;255;49min\x1b[0m\x1b[38;2;238;255;255;"
-        "49m \x1b[0m\x1b[38;2;130;170;255;49mrange\x1b[0m\x1b"
-        "[38;2;137;221;255;49m(\x1b[0m\x1b[38;2;247;140"
-        ";108;49m20\x1b[0m\x1b[38;2;137;221;255;49m)\x1b[0"
-        "m\x1b[38;2;137;221;255;49m:\x1b[0m            "
-        "                                        "
-        "   \n  \x1b[38;2;238;255;255;49m       \x1b[0m\x1b"
-        "[38;2;130;170;255;49mprint\x1b[0m\x1b[38;2;137"
-        ";221;255;49m(\x1b[0m\x1b[38;2;238;255;255;49mi"
-        "\x1b[0m\x1b[38;2;137;221;255;49m)\x1b[0m         "
-        "                                        "
-        "              \n                         "
-        "                                        "
-        "               \n   \x1b[1maaa\x1b[0m          "
-        "                           \x1b[1mbbbb \x1b[0m"
-        "\x1b[1mccc\x1b[0m                             "
-        "\n  ─────────────────────────────────────"
-        "────────────────────────────────────────"
-        "─\n   111 \x1b[1m222\x1b[0m 333                "
-        "             222                        "
-        "          \n   susu                      "
-        "              lulu                      "
-        "           \n                            "
-        "                                        "
-        "            \n                           "
-        "                                        "
-        "             \n   • so there you are     "
-        "                                        "
-        "              \n   • words               "
-        "                                        "
-        "               \n                        "
-        "                                        "
-        "                \n   \x1b[1mddd\x1b[0m         "
-        "                            \x1b[1;97;40mee"
-        "ee\x1b[0m\x1b[1m fff\x1b[0m                      "
-        "       \n  ──────────────────────────────"
-        "────────────────────────────────────────"
-        "────────\n                               "
-        "                                        "
-        "         \n                              "
-        "                                        "
-        "          \n                             "
-        "                                        "
-        "           \n                            "
-        "                                        "
-        "            \n  ─────────────────────────"
-        "────────────────────────────────────────"
-        "─────────────\n   sus                    "
-        "                 \x1b[3mspect\x1b[0m          "
-        "                      \n                 "
-        "                                        "
-        "                       \n  rak           "
-        "                                        "
-        "                        \n"
-    )
     assert output == expected_output
 
 
-def test_heading_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_heading_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with headings."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -754,38 +562,6 @@ def test_heading_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "# Heading 1\n## Heading 2\n### Heading 3\n#### Heading 4\n",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "  \x1b[1;38;5;231;48;5;57m \x1b[0m\x1b[1;38;5;231"
-        ";48;5;57mHeading 1\x1b[0m\x1b[1;38;5;231;48;5;"
-        "57m \x1b[0m\x1b[1;38;5;231;48;5;57m           "
-        "                                        "
-        "                \x1b[0m\n  \x1b[2;38;5;57m─────"
-        "────────────────────────────────────────"
-        "─────────────────────────────────\x1b[0m\n  "
-        "                                        "
-        "                                      \n "
-        "                                        "
-        "                                       \n"
-        "  \x1b[1;38;5;37m## \x1b[0m\x1b[1;38;5;37mHeading"
-        " 2\x1b[0m\x1b[1;38;5;37m                      "
-        "                                        "
-        "    \x1b[0m\n  \x1b[2;38;5;37m─────────────────"
-        "────────────────────────────────────────"
-        "─────────────────────\x1b[0m\n              "
-        "                                        "
-        "                          \n             "
-        "                                        "
-        "                           \n  \x1b[1;38;5;3"
-        "7m### \x1b[0m\x1b[1;38;5;37mHeading 3\x1b[0m\x1b[1;3"
-        "8;5;37m                                 "
-        "                                \x1b[0m\n   "
-        "                                        "
-        "                                     \n  "
-        "\x1b[1;38;5;37m#### \x1b[0m\x1b[1;38;5;37mHeading"
-        " 4\x1b[0m\x1b[1;38;5;37m                      "
-        "                                        "
-        "  \x1b[0m\n"
-    )
     assert output == expected_output
 
 
@@ -809,7 +585,9 @@ def test_wide_heading_markdown_cell(rich_notebook_output: RichOutput) -> None:
     assert output == expected_output
 
 
-def test_ruler_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_ruler_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with a ruler."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -818,21 +596,12 @@ def test_ruler_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "Section 1\n\n---\n\nsection 2\n",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "  Section 1                             "
-        "                                        "
-        "\n                                       "
-        "                                        "
-        " \n  ────────────────────────────────────"
-        "────────────────────────────────────────"
-        "──\n  section 2                          "
-        "                                        "
-        "   \n"
-    )
     assert output == expected_output
 
 
-def test_bullet_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_bullet_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with bullets."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -841,21 +610,12 @@ def test_bullet_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "- Item 1\n- Item 2\n  - Item 3\n",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "                                        "
-        "                                        "
-        "\n   • Item 1                            "
-        "                                        "
-        " \n   • Item 2                           "
-        "                                        "
-        "  \n      • Item 3                       "
-        "                                        "
-        "   \n"
-    )
     assert output == expected_output
 
 
-def test_number_markdown_cell(rich_notebook_output: RichOutput) -> None:
+def test_number_markdown_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown cell with numbers."""
     markdown_cell = {
         "cell_type": "markdown",
@@ -864,17 +624,6 @@ def test_number_markdown_cell(rich_notebook_output: RichOutput) -> None:
         "source": "1. Item 1\n2. Item 2\n3. Item 3\n",
     }
     output = rich_notebook_output(markdown_cell)
-    expected_output = (
-        "                                        "
-        "                                        "
-        "\n  1. Item 1                            "
-        "                                        "
-        " \n  2. Item 2                           "
-        "                                        "
-        "  \n  3. Item 3                          "
-        "                                        "
-        "   \n"
-    )
     assert output == expected_output
 
 
@@ -948,7 +697,9 @@ def test_image_file_link_not_exist_markdown_cell(
     assert remove_link_ids(output) == remove_link_ids(expected_output)
 
 
-def test_notebook_code_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_code_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a code cell."""
     code_cell = {
         "cell_type": "code",
@@ -959,40 +710,12 @@ def test_notebook_code_cell(rich_notebook_output: RichOutput) -> None:
         "source": "def foo(x: float, y: float) -> float:\n    return x + y",
     }
     output = rich_notebook_output(code_cell)
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │ \x1b[38;2;187;128;17"
-        "9;49mdef\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;130;170;255;49mfoo\x1b[0m\x1b[38;2;137;2"
-        "21;255;49m(\x1b[0m\x1b[38;2;238;255;255;49mx\x1b["
-        "0m\x1b[38;2;137;221;255;49m:\x1b[0m\x1b[38;2;238;"
-        "255;255;49m \x1b[0m\x1b[38;2;130;170;255;49mfl"
-        "oat\x1b[0m\x1b[38;2;137;221;255;49m,\x1b[0m\x1b[38;2"
-        ";238;255;255;49m \x1b[0m\x1b[38;2;238;255;255;"
-        "49my\x1b[0m\x1b[38;2;137;221;255;49m:\x1b[0m\x1b[38;"
-        "2;238;255;255;49m \x1b[0m\x1b[38;2;130;170;255"
-        ";49mfloat\x1b[0m\x1b[38;2;137;221;255;49m)\x1b[0m"
-        "\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;137;22"
-        "1;255;49m-\x1b[0m\x1b[38;2;137;221;255;49m>\x1b[0"
-        "m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;130;1"
-        "70;255;49mfloat\x1b[0m\x1b[38;2;137;221;255;49"
-        "m:\x1b[0m                                  "
-        " │\n     │ \x1b[38;2;238;255;255;49m    \x1b[0m"
-        "\x1b[38;2;187;128;179;49mreturn\x1b[0m\x1b[38;2;2"
-        "38;255;255;49m \x1b[0m\x1b[38;2;238;255;255;49"
-        "mx\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;"
-        "137;221;255;49m+\x1b[0m\x1b[38;2;238;255;255;4"
-        "9m \x1b[0m\x1b[38;2;238;255;255;49my\x1b[0m      "
-        "                                        "
-        "          │\n     ╰──────────────────────"
-        "────────────────────────────────────────"
-        "───────────╯\n"
-    )
     assert output == expected_output
 
 
-def test_notebook_magic_code_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_magic_code_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a code cell in a language specified by cell magic."""
     code_cell = {
         "cell_type": "code",
@@ -1002,20 +725,6 @@ def test_notebook_magic_code_cell(rich_notebook_output: RichOutput) -> None:
         "outputs": [],
         "source": "%%bash\necho 'lorep'",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │ \x1b[38;2;137;221;25"
-        "5;49m%%\x1b[0m\x1b[38;2;187;128;179;49mbash\x1b[0"
-        "m                                       "
-        "                           │\n     │ \x1b[38"
-        ";2;130;170;255;49mecho\x1b[0m\x1b[38;2;238;255"
-        ";255;49m \x1b[0m\x1b[38;2;195;232;141;49m'lore"
-        "p'\x1b[0m                                  "
-        "                          │\n     ╰──────"
-        "────────────────────────────────────────"
-        "───────────────────────────╯\n"
-    )
     output = rich_notebook_output(code_cell)
     assert output == expected_output
 
@@ -1034,7 +743,9 @@ def test_notebook_raw_cell(rich_notebook_output: RichOutput) -> None:
     assert output == expected_output
 
 
-def test_notebook_non_syntax_magic_code_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_non_syntax_magic_code_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It uses the default highlighting when magic is not a syntax."""
     code_cell = {
         "cell_type": "code",
@@ -1044,44 +755,13 @@ def test_notebook_non_syntax_magic_code_cell(rich_notebook_output: RichOutput) -
         "outputs": [],
         "source": "%%timeit\ndef foo(x: float, y: float) -> float:\n    return x + y",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │ \x1b[38;2;137;221;25"
-        "5;49m%%time\x1b[0m\x1b[38;2;238;255;255;49mit\x1b"
-        "[0m                                     "
-        "                           │\n     │ \x1b[38"
-        ";2;187;128;179;49mdef\x1b[0m\x1b[38;2;238;255;"
-        "255;49m \x1b[0m\x1b[38;2;130;170;255;49mfoo\x1b[0"
-        "m\x1b[38;2;137;221;255;49m(\x1b[0m\x1b[38;2;238;2"
-        "55;255;49mx\x1b[0m\x1b[38;2;137;221;255;49m:\x1b["
-        "0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;130;"
-        "170;255;49mfloat\x1b[0m\x1b[38;2;137;221;255;4"
-        "9m,\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2"
-        ";238;255;255;49my\x1b[0m\x1b[38;2;137;221;255;"
-        "49m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;"
-        "2;130;170;255;49mfloat\x1b[0m\x1b[38;2;137;221"
-        ";255;49m)\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m"
-        "\x1b[38;2;137;221;255;49m-\x1b[0m\x1b[38;2;137;22"
-        "1;255;49m>\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0"
-        "m\x1b[38;2;130;170;255;49mfloat\x1b[0m\x1b[38;2;1"
-        "37;221;255;49m:\x1b[0m                     "
-        "              │\n     │ \x1b[38;2;238;255;25"
-        "5;49m    \x1b[0m\x1b[38;2;187;128;179;49mretur"
-        "n\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;2"
-        "38;255;255;49mx\x1b[0m\x1b[38;2;238;255;255;49"
-        "m \x1b[0m\x1b[38;2;137;221;255;49m+\x1b[0m\x1b[38;2;"
-        "238;255;255;49m \x1b[0m\x1b[38;2;238;255;255;4"
-        "9my\x1b[0m                                 "
-        "                       │\n     ╰─────────"
-        "────────────────────────────────────────"
-        "────────────────────────╯\n"
-    )
     output = rich_notebook_output(code_cell)
     assert output == expected_output
 
 
-def test_notebook_plain_code_cell(rich_notebook_output: RichOutput) -> None:
+def test_notebook_plain_code_cell(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a code cell with plain formatting."""
     code_cell = {
         "cell_type": "code",
@@ -1092,41 +772,18 @@ def test_notebook_plain_code_cell(rich_notebook_output: RichOutput) -> None:
         "source": "def foo(x: float, y: float) -> float:\n    return x + y",
     }
     output = rich_notebook_output(code_cell, plain=True)
-    expected_output = (
-        "\x1b[38;2;187;128;179;49mdef\x1b[0m\x1b[38;2;238;"
-        "255;255;49m \x1b[0m\x1b[38;2;130;170;255;49mfo"
-        "o\x1b[0m\x1b[38;2;137;221;255;49m(\x1b[0m\x1b[38;2;2"
-        "38;255;255;49mx\x1b[0m\x1b[38;2;137;221;255;49"
-        "m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;"
-        "130;170;255;49mfloat\x1b[0m\x1b[38;2;137;221;2"
-        "55;49m,\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b["
-        "38;2;238;255;255;49my\x1b[0m\x1b[38;2;137;221;"
-        "255;49m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;130;170;255;49mfloat\x1b[0m\x1b[38;2;137"
-        ";221;255;49m)\x1b[0m\x1b[38;2;238;255;255;49m "
-        "\x1b[0m\x1b[38;2;137;221;255;49m-\x1b[0m\x1b[38;2;13"
-        "7;221;255;49m>\x1b[0m\x1b[38;2;238;255;255;49m"
-        " \x1b[0m\x1b[38;2;130;170;255;49mfloat\x1b[0m\x1b[38"
-        ";2;137;221;255;49m:\x1b[0m                 "
-        "                          \n\x1b[38;2;238;25"
-        "5;255;49m    \x1b[0m\x1b[38;2;187;128;179;49mr"
-        "eturn\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38"
-        ";2;238;255;255;49mx\x1b[0m\x1b[38;2;238;255;25"
-        "5;49m \x1b[0m\x1b[38;2;137;221;255;49m+\x1b[0m\x1b[3"
-        "8;2;238;255;255;49m \x1b[0m\x1b[38;2;238;255;2"
-        "55;49my\x1b[0m                             "
-        "                                   \n"
-    )
     assert output == expected_output
 
 
+@pytest.mark.parametrize("plain", [False, True], ids=["rich", "plain"])
 def test_render_dataframe(
+    plain: bool,
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
-    """It renders a DataFrame."""
+    """It renders a DataFrame, or its plain text when plain is True."""
     code_cell = {
         "cell_type": "code",
         "execution_count": 2,
@@ -1188,54 +845,15 @@ def test_render_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        "\x1b]8;id=1627258210.84976-39532;"
-        f"file://{tempfile_path}0.html\x1b\\\x1b[94"
-        "m🌐 Click to view HTML\x1b[0m\x1b]8;;\x1b\\        "
-        "                                        "
-        "     \n                                  "
-        "                                        "
-        "      \n\x1b[38;5;247m[2]:\x1b[0m   \x1b[1m     \x1b["
-        "0m   \x1b[1m      \x1b[0m   \x1b[1mlorep\x1b[0m     "
-        "   \x1b[1m           hey\x1b[0m   \x1b[1mbye\x1b[0m "
-        "                      \n       \x1b[1m     \x1b"
-        "[0m   \x1b[1m      \x1b[0m   \x1b[1mipsum\x1b[0m   \x1b"
-        "[1mhi\x1b[0m   \x1b[1mvery_long_word\x1b[0m   \x1b[1"
-        "m hi\x1b[0m                       \n       \x1b"
-        "[1mfirst\x1b[0m   \x1b[1msecond\x1b[0m   \x1b[1mthir"
-        "d\x1b[0m   \x1b[1m  \x1b[0m   \x1b[1m              \x1b"
-        "[0m   \x1b[1m   \x1b[0m                       "
-        "\n      ─────────────────────────────────"
-        "───────────────────                     "
-        " \n       \x1b[1m  bar\x1b[0m   \x1b[1m   one\x1b[0m "
-        "  \x1b[1m    1\x1b[0m    1                2   "
-        "  4                       \n             "
-        "           \x1b[1m   10\x1b[0m    3           "
-        "     4    -1                       \n    "
-        "           \x1b[1m three\x1b[0m   \x1b[1m    3\x1b[0"
-        "m    3                4    -1           "
-        "            \n       \x1b[1m  foo\x1b[0m   \x1b[1m"
-        "   one\x1b[0m   \x1b[1m    1\x1b[0m    3         "
-        "       4    -1                       \n"
-    )
-    output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    output = rich_notebook_output(code_cell, plain=plain)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_wide_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It enforces a minimum width when rendering wide DataFrame."""
     code_cell = {
@@ -1330,40 +948,14 @@ def test_render_wide_dataframe(
         "source": "",
     }
     output = rich_notebook_output(code_cell)
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[5]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[5]:\x1b[0m  "
-        f"\x1b]8;id=757847;file://{tempfile_path}0.html"
-        "\x1b\\\x1b[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[5]:\x1b[0m   \x1b[1m \x1b[0m   \x1b[1mcol…\x1b[0m   "
-        "\x1b[1mcol…\x1b[0m   \x1b[1mcol…\x1b[0m   \x1b[1mcol…\x1b["
-        "0m   \x1b[1mcol…\x1b[0m   \x1b[1mcol…\x1b[0m   \x1b[1mc"
-        "ol…\x1b[0m   \x1b[1mcol…\x1b[0m   \x1b[1mcol…\x1b[0m   "
-        "\x1b[1mcol…\x1b[0m  \n      ───────────────────"
-        "────────────────────────────────────────"
-        "───────────────\n       \x1b[1m0\x1b[0m   0.2… "
-        "  0.9…   0.1…   0.9…   0.2…   0.2…   0.2"
-        "…   0.6…   0.5…   0.7…  \n"
-    )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_only_header_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with only headers."""
     code_cell = {
@@ -1419,51 +1011,15 @@ def test_only_header_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=360825;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m   Model:\x1b[0m          "
-        "  \x1b[1m Decision\x1b[0m            \x1b[1mRegre"
-        "ssi…\x1b[0m            \x1b[1m   Random\x1b[0m \n "
-        "                           \x1b[1m     Tree"
-        "\x1b[0m                                    "
-        "       \n       \x1b[1mPredicte…\x1b[0m   \x1b[1mT"
-        "umour\x1b[0m   \x1b[1mNon-Tumo…\x1b[0m   \x1b[1mTumo"
-        "ur\x1b[0m   \x1b[1mNon-Tumo…\x1b[0m   \x1b[1mTumour\x1b"
-        "[0m   \x1b[1mNon-Tumo…\x1b[0m \n       \x1b[1m   A"
-        "ctual\x1b[0m   \x1b[1m      \x1b[0m   \x1b[1m       "
-        "  \x1b[0m   \x1b[1m      \x1b[0m   \x1b[1m         \x1b"
-        "[0m   \x1b[1m      \x1b[0m   \x1b[1m         \x1b[0m"
-        " \n       \x1b[1m   Label:\x1b[0m              "
-        "                                        "
-        "          \n      ───────────────────────"
-        "────────────────────────────────────────"
-        "───────────\n                            "
-        "                                        "
-        "            \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_mistagged_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It doesn't detect a DataFrame when it is not a table."""
     code_cell = {
@@ -1527,47 +1083,15 @@ def test_render_mistagged_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=806532;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m  lorep              hey      "
-        "          bye                           "
-        "      \n      ipsum               hi very"
-        "_long_word  hi                          "
-        "       \n      first second third        "
-        "                                        "
-        "        \n      bar   one    1       1   "
-        "           2   4                        "
-        "         \n                   10      3  "
-        "            4  -1                       "
-        "          \n            three  3       3 "
-        "             4  -1                      "
-        "           \n      foo   one    1       3"
-        "              4  -1                     "
-        "            \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_multiindex_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a multiindex DataFrame."""
     code_cell = {
@@ -1631,58 +1155,15 @@ def test_render_multiindex_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=888128;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m   Model:\x1b[0m          "
-        "  \x1b[1m Decision\x1b[0m            \x1b[1mRegre"
-        "ssi…\x1b[0m            \x1b[1m   Random\x1b[0m \n "
-        "                           \x1b[1m     Tree"
-        "\x1b[0m                                    "
-        "       \n       \x1b[1mPredicte…\x1b[0m   \x1b[1mT"
-        "umour\x1b[0m   \x1b[1mNon-Tumo…\x1b[0m   \x1b[1mTumo"
-        "ur\x1b[0m   \x1b[1mNon-Tumo…\x1b[0m   \x1b[1mTumour\x1b"
-        "[0m   \x1b[1mNon-Tumo…\x1b[0m \n       \x1b[1m   A"
-        "ctual\x1b[0m   \x1b[1m      \x1b[0m   \x1b[1m       "
-        "  \x1b[0m   \x1b[1m      \x1b[0m   \x1b[1m         \x1b"
-        "[0m   \x1b[1m      \x1b[0m   \x1b[1m         \x1b[0m"
-        " \n       \x1b[1m   Label:\x1b[0m              "
-        "                                        "
-        "          \n      ───────────────────────"
-        "────────────────────────────────────────"
-        "───────────\n       \x1b[1m   Tumour\x1b[0m    "
-        " 38.0         2.0     18.0        22.0  "
-        "     21         NaN \n       \x1b[1m(Positiv"
-        "…\x1b[0m                                   "
-        "                             \n       \x1b[1"
-        "mNon-Tumo…\x1b[0m     19.0       439.0     "
-        " 6.0       452.0      226       232.0 \n "
-        "      \x1b[1m(Negativ…\x1b[0m                 "
-        "                                        "
-        "       \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_styled_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a styled DataFrame."""
     code_cell = {
@@ -1763,48 +1244,15 @@ def test_render_styled_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=698065;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m               Model:\x1b["
-        "0m            \x1b[1mDecision Tree\x1b[0m     "
-        "       \x1b[1mRegression\x1b[0m     \n       \x1b["
-        "1m           Predicted:\x1b[0m   \x1b[1mTumour"
-        "\x1b[0m   \x1b[1m   Non-Tumour\x1b[0m   \x1b[1mTumou"
-        "r\x1b[0m   \x1b[1mNon-Tumour\x1b[0m     \n       \x1b"
-        "[1m        Actual Label:\x1b[0m   \x1b[1m     "
-        " \x1b[0m   \x1b[1m             \x1b[0m   \x1b[1m    "
-        "  \x1b[0m   \x1b[1m          \x1b[0m     \n      ─"
-        "────────────────────────────────────────"
-        "─────────────────────────────    \n      "
-        " \x1b[1m    Tumour (Positive)\x1b[0m       38 "
-        "              2       18           22   "
-        "  \n       \x1b[1mNon-Tumour (Negative)\x1b[0m "
-        "      19             439        6       "
-        "   452     \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_missing_column_name_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with a missing column index name."""
     code_cell = {
@@ -1856,46 +1304,15 @@ def test_render_missing_column_name_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=337911;file://{tempfile_path}0.html\x1b\\\x1b[94m🌐 "
-        "Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m   \x1b[0m   \x1b[1mlorep\x1b[0m"
-        "   \x1b[1mhey\x1b[0m   \x1b[1msup\x1b[0m   \x1b[1mbye\x1b["
-        "0m                                      "
-        "      \n       \x1b[1mhey\x1b[0m   \x1b[1m     \x1b[0"
-        "m   \x1b[1m   \x1b[0m   \x1b[1m   \x1b[0m   \x1b[1m   \x1b"
-        "[0m                                     "
-        "       \n      ──────────────────────────"
-        "─────                                   "
-        "        \n       \x1b[1m  3\x1b[0m   \x1b[1m    1\x1b"
-        "[0m     1     4     6                   "
-        "                         \n       \x1b[1m  4"
-        "\x1b[0m   \x1b[1m    1\x1b[0m     2     5     7  "
-        "                                        "
-        "  \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_missing_index_name_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with a missing index index name."""
     code_cell = {
@@ -1946,46 +1363,15 @@ def test_render_missing_index_name_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=308498;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m \x1b[0m   \x1b[1m   \x1b[0m   \x1b"
-        "[1ma\x1b[0m   \x1b[1mb\x1b[0m   \x1b[1mc\x1b[0m        "
-        "                                        "
-        "      \n       \x1b[1m \x1b[0m   \x1b[1mhey\x1b[0m   "
-        "\x1b[1m \x1b[0m   \x1b[1m \x1b[0m   \x1b[1m \x1b[0m       "
-        "                                        "
-        "       \n      ─────────────────────     "
-        "                                        "
-        "        \n       \x1b[1m3\x1b[0m   \x1b[1m  1\x1b[0m "
-        "  1   4   6                             "
-        "                         \n       \x1b[1m4\x1b["
-        "0m   \x1b[1m  1\x1b[0m   2   5   7            "
-        "                                        "
-        "  \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_missing_last_index_name_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with missing lasst index index name."""
     code_cell = {
@@ -2036,152 +1422,15 @@ def test_render_missing_last_index_name_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=59302;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view "
-        "HTML\x1b[0m\x1b]8;;\x1b\\                         "
-        "                            \n           "
-        "                                        "
-        "                             \n\x1b[38;5;247"
-        "m[2]:\x1b[0m   \x1b[1m   \x1b[0m   \x1b[1m \x1b[0m   \x1b["
-        "1ma\x1b[0m   \x1b[1mb\x1b[0m   \x1b[1mc\x1b[0m         "
-        "                                        "
-        "     \n       \x1b[1mhey\x1b[0m   \x1b[1m \x1b[0m   \x1b"
-        "[1m \x1b[0m   \x1b[1m \x1b[0m   \x1b[1m \x1b[0m        "
-        "                                        "
-        "      \n      ─────────────────────      "
-        "                                        "
-        "       \n       \x1b[1m  3\x1b[0m   \x1b[1m1\x1b[0m  "
-        " 1   4   6                              "
-        "                        \n       \x1b[1m  4\x1b"
-        "[0m   \x1b[1m1\x1b[0m   2   5   7             "
-        "                                        "
-        " \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
-
-
-def test_render_plain_dataframe(
-    rich_notebook_output: RichOutput,
-    mock_tempfile_file: Generator[Mock, None, None],
-    remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
-) -> None:
-    """It renders a DataFrame as normal when plain is True."""
-    code_cell = {
-        "cell_type": "code",
-        "execution_count": 2,
-        "id": "mighty-oasis",
-        "metadata": {},
-        "outputs": [
-            {
-                "data": {
-                    "text/html": (
-                        "<div>\n<style scoped>\n    .dataframe tbod"
-                        "y tr th:only-of-type {\n        vertical-"
-                        "align: middle;\n    }\n\n    .dataframe tbo"
-                        "dy tr th {\n        vertical-align: top;\n"
-                        "    }\n\n    .dataframe thead tr th {\n    "
-                        "    text-align: left;\n    }\n\n    .datafr"
-                        "ame thead tr:last-of-type th {\n        t"
-                        "ext-align: right;\n    }\n</style>\n<table "
-                        'border="1" class="dataframe">\n  <thead>\n'
-                        "    <tr>\n      <th></th>\n      <th></th>"
-                        "\n      <th>lorep</th>\n      <th colspan="
-                        '"2" halign="left">hey</th>\n      <th>bye'
-                        "</th>\n    </tr>\n    <tr>\n      <th></th>"
-                        "\n      <th></th>\n      <th>ipsum</th>\n  "
-                        "    <th>hi</th>\n      <th>very_long_word"
-                        "</th>\n      <th>hi</th>\n    </tr>\n    <t"
-                        "r>\n      <th>first</th>\n      <th>second"
-                        "</th>\n      <th>third</th>\n      <th></t"
-                        "h>\n      <th></th>\n      <th></th>\n    <"
-                        "/tr>\n  </thead>\n  <tbody>\n    <tr>\n     "
-                        ' <th rowspan="3" valign="top">bar</th>\n '
-                        '     <th rowspan="2" valign="top">one</t'
-                        "h>\n      <th>1</th>\n      <td>1</td>\n   "
-                        "   <td>2</td>\n      <td>4</td>\n    </tr>"
-                        "\n    <tr>\n      <th>10</th>\n      <td>3<"
-                        "/td>\n      <td>4</td>\n      <td>-1</td>\n"
-                        "    </tr>\n    <tr>\n      <th>three</th>\n"
-                        "      <th>3</th>\n      <td>3</td>\n      "
-                        "<td>4</td>\n      <td>-1</td>\n    </tr>\n "
-                        "   <tr>\n      <th>foo</th>\n      <th>one"
-                        "</th>\n      <th>1</th>\n      <td>3</td>\n"
-                        "      <td>4</td>\n      <td>-1</td>\n    <"
-                        "/tr>\n  </tbody>\n</table>\n</div>"
-                    ),
-                    "text/plain": (
-                        "lorep              hey                by"
-                        "e\nipsum               hi very_long_word "
-                        " hi\nfirst second third                  "
-                        "     \nbar   one    1       1            "
-                        "  2   4\n             10      3          "
-                        "    4  -1\n      three  3       3        "
-                        "      4  -1\nfoo   one    1       3      "
-                        "        4  -1"
-                    ),
-                },
-                "execution_count": 2,
-                "metadata": {},
-                "output_type": "execute_result",
-            }
-        ],
-        "source": "",
-    }
-    expected_output = (
-        "                                        "
-        "                                        "
-        "\n                                       "
-        "                                        "
-        f" \n\x1b]8;id=594763;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to vi"
-        "ew HTML\x1b[0m\x1b]8;;\x1b\\                      "
-        "                                     \n  "
-        "                                        "
-        "                                      \n "
-        "\x1b[1m     \x1b[0m   \x1b[1m      \x1b[0m   \x1b[1mlor"
-        "ep\x1b[0m        \x1b[1m           hey\x1b[0m   \x1b"
-        "[1mbye\x1b[0m                             \n"
-        " \x1b[1m     \x1b[0m   \x1b[1m      \x1b[0m   \x1b[1mip"
-        "sum\x1b[0m   \x1b[1mhi\x1b[0m   \x1b[1mvery_long_wor"
-        "d\x1b[0m   \x1b[1m hi\x1b[0m                     "
-        "        \n \x1b[1mfirst\x1b[0m   \x1b[1msecond\x1b[0m"
-        "   \x1b[1mthird\x1b[0m   \x1b[1m  \x1b[0m   \x1b[1m    "
-        "          \x1b[0m   \x1b[1m   \x1b[0m            "
-        "                 \n──────────────────────"
-        "──────────────────────────────          "
-        "                  \n \x1b[1m  bar\x1b[0m   \x1b[1m"
-        "   one\x1b[0m   \x1b[1m    1\x1b[0m    1         "
-        "       2     4                          "
-        "   \n                  \x1b[1m   10\x1b[0m    3"
-        "                4    -1                 "
-        "            \n         \x1b[1m three\x1b[0m   \x1b"
-        "[1m    3\x1b[0m    3                4    -1"
-        "                             \n \x1b[1m  foo"
-        "\x1b[0m   \x1b[1m   one\x1b[0m   \x1b[1m    1\x1b[0m   "
-        " 3                4    -1               "
-        "              \n"
-    )
-    output = rich_notebook_output(code_cell, plain=True)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_uneven_columns_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with missing columns."""
     code_cell = {
@@ -2298,50 +1547,15 @@ def test_render_uneven_columns_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=635975;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1m           Model:\x1b[0m  "
-        "              \x1b[1mDecision Tree\x1b[0m     "
-        "           \x1b[1mRegression\x1b[0m \n       \x1b["
-        "1m           Tumour\x1b[0m   \x1b[1mNon-Tumour"
-        "\x1b[0m   \x1b[1m       Tumour\x1b[0m   \x1b[1mNon-T"
-        "umour\x1b[0m              \n       \x1b[1m    A"
-        "ctual Label:\x1b[0m   \x1b[1m          \x1b[0m   "
-        "\x1b[1m             \x1b[0m   \x1b[1m          \x1b["
-        "0m   \x1b[1m          \x1b[0m \n      ─────────"
-        "────────────────────────────────────────"
-        "─────────────────────────\n       \x1b[1mTum"
-        "our (Positive)\x1b[0m           38         "
-        "      2           18           22 \n     "
-        "  \x1b[1m       Non-Tumour\x1b[0m           19"
-        "             439            6          4"
-        "52 \n       \x1b[1m       (Negative)\x1b[0m    "
-        "                                        "
-        "            \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_no_columns_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with missing columns."""
     code_cell = {
@@ -2420,37 +1634,15 @@ def test_render_no_columns_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=380451;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1mTumour (Positive)    \x1b["
-        "0m   38   2     18   22                 "
-        "              \n       \x1b[1mNon-Tumour (Ne"
-        "gative)\x1b[0m   19   439   6    452       "
-        "                       \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_uneven_data_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with non square data."""
     code_cell = {
@@ -2527,37 +1719,15 @@ def test_render_uneven_data_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=330589;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   \x1b[1mTumour (Positive)    \x1b["
-        "0m   2    18    22                      "
-        "              \n       \x1b[1mNon-Tumour (Ne"
-        "gative)\x1b[0m   19   439   6    452       "
-        "                       \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_uneven_index_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a DataFrame with uneven index names."""
     code_cell = {
@@ -2631,37 +1801,15 @@ def test_render_uneven_index_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=487619;file://{tempfile_path}0.html\x1b\\\x1b"
-        "[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m   2                       18 "
-        "  22                                    "
-        "      \n       \x1b[1mNon-Tumour (Negative)\x1b"
-        "[0m   19   439   6   452                "
-        "               \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_empty_html_dataframe(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a blank output when given an empty table."""
     code_cell = {
@@ -2707,31 +1855,13 @@ def test_render_empty_html_dataframe(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=316923;file://{tempfile_path}0.html"
-        "\x1b\\\x1b[94m🌐 Click to view"
-        " HTML\x1b[0m\x1b]8;;\x1b\\                        "
-        "                             \n          "
-        "                                        "
-        "                              \n\x1b[38;5;24"
-        "7m[2]:\x1b[0m                              "
-        "                                        "
-        "      \n"
-    )
     output = rich_notebook_output(code_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
-def test_render_stderr_stream(rich_notebook_output: RichOutput) -> None:
+def test_render_stderr_stream(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders the stderr stream."""
     stderr_cell = {
         "cell_type": "code",
@@ -2748,34 +1878,13 @@ def test_render_stderr_stream(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[5]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b[48;5;174m    "
-        "                                        "
-        "                              \x1b[0m\n     "
-        " \x1b[48;5;174m \x1b[0m\x1b[38;5;237;48;5;174m<ip"
-        "ython-input-5-bc08279b5148>:2: UserWarni"
-        "ng: Lorep                    \x1b[0m\x1b[48;5;"
-        "174m \x1b[0m\n      \x1b[48;5;174m \x1b[0m\x1b[38;5;2"
-        '37;48;5;174m warnings.warn("Lorep")     '
-        "                                        "
-        "    \x1b[0m\x1b[48;5;174m \x1b[0m\n      \x1b[48;5;17"
-        "4m \x1b[0m\x1b[38;5;237;48;5;174m             "
-        "                                        "
-        "                   \x1b[0m\x1b[48;5;174m \x1b[0m\n"
-    )
     output = rich_notebook_output(stderr_cell)
     assert output == expected_output
 
 
-def test_render_stream_stdout(rich_notebook_output: RichOutput) -> None:
+def test_render_stream_stdout(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders stdout."""
     stdout_cell = {
         "cell_type": "code",
@@ -2785,24 +1894,13 @@ def test_render_stream_stdout(rich_notebook_output: RichOutput) -> None:
         "outputs": [{"name": "stdout", "output_type": "stream", "text": "Lorep\n"}],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[6]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      Lorep          "
-        "                                        "
-        "                   \n"
-    )
     output = rich_notebook_output(stdout_cell)
     assert output == expected_output
 
 
-def test_render_error_traceback(rich_notebook_output: RichOutput) -> None:
+def test_render_error_traceback(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders the traceback from an error."""
     traceback_cell = {
         "cell_type": "code",
@@ -2830,34 +1928,6 @@ def test_render_error_traceback(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[7]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b[1;31m--------"
-        "----------------------------------------"
-        "-------------------------…\x1b[0m\n      \x1b[1"
-        ";31mZeroDivisionError\x1b[0m               "
-        "          Traceback (most recent call   "
-        "  \n      last)                          "
-        "                                        "
-        "   \n      \x1b[1;32m<ipython-input-7-9e1622"
-        "b385b6>\x1b[0m in \x1b[36m<module>\x1b[0m        "
-        "                        \n      \x1b[1;32m--"
-        "--> 1\x1b[0m\x1b[1;33m \x1b[0m\x1b[1;36m1\x1b[0m\x1b[1;33m"
-        "/\x1b[0m\x1b[1;36m0\x1b[0m                       "
-        "                                        "
-        "\n                                       "
-        "                                        "
-        " \n      \x1b[1;31mZeroDivisionError\x1b[0m: di"
-        "vision by zero                          "
-        "             \n"
-    )
     output = rich_notebook_output(traceback_cell)
     assert output == expected_output
 
@@ -3046,7 +2116,7 @@ def test_render_debugger_output(
     assert output == expected_output
 
 
-def test_render_result(rich_notebook_output: RichOutput) -> None:
+def test_render_result(rich_notebook_output: RichOutput, expected_output: str) -> None:
     """It renders a result."""
     output_cell = {
         "cell_type": "code",
@@ -3063,54 +2133,13 @@ def test_render_result(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        "3                                       "
-        "                                  \n"
-    )
-    output = rich_notebook_output(output_cell)
-    assert output == expected_output
-
-
-def test_render_unknown_data_format(rich_notebook_output: RichOutput) -> None:
-    """It passes on rendering an unknown data format."""
-    output_cell = {
-        "cell_type": "code",
-        "execution_count": 2,
-        "id": "intense-middle",
-        "metadata": {},
-        "outputs": [
-            {
-                "data": {"unknown_format": "3"},
-                "execution_count": 2,
-                "metadata": {},
-                "output_type": "execute_result",
-            }
-        ],
-        "source": "",
-    }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n"
-    )
     output = rich_notebook_output(output_cell)
     assert output == expected_output
 
 
-def test_render_error_no_traceback(rich_notebook_output: RichOutput) -> None:
+def test_render_error_no_traceback(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It skips rendering an error with no traceback."""
     traceback_cell = {
         "cell_type": "code",
@@ -3127,24 +2156,13 @@ def test_render_error_no_traceback(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[7]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n                     "
-        "                                        "
-        "                   \n"
-    )
     output = rich_notebook_output(traceback_cell)
     assert output == expected_output
 
 
-def test_render_markdown_output(rich_notebook_output: RichOutput) -> None:
+def test_render_markdown_output(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a markdown output."""
     markdown_output_cell = {
         "cell_type": "code",
@@ -3163,45 +2181,39 @@ def test_render_markdown_output(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "%%markdown\n**Lorep** _ipsum_",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │ \x1b[38;2;137;221;25"
-        "5;49m%%\x1b[0m\x1b[38;2;187;128;179;49mmarkdow"
-        "n\x1b[0m                                   "
-        "                           │\n     │ \x1b[38"
-        ";2;255;83;112;49m**Lorep**\x1b[0m\x1b[38;2;238"
-        ";255;255;49m \x1b[0m\x1b[38;2;137;221;255;49m_"
-        "ipsum_\x1b[0m                              "
-        "                         │\n     ╰───────"
-        "────────────────────────────────────────"
-        "──────────────────────────╯\n            "
-        "                                        "
-        "                            \n      \x1b[1mL"
-        "orep\x1b[0m \x1b[3mipsum\x1b[0m                  "
-        "                                        "
-        "     \n"
-    )
     output = rich_notebook_output(markdown_output_cell)
     assert output == expected_output
 
 
-def test_render_unknown_display_data(rich_notebook_output: RichOutput) -> None:
-    """It skips rendering an unknown data display type."""
-    unknown_display_data_cell = {
+@pytest.mark.parametrize(
+    "unknown_output",
+    [
+        {
+            "data": {"unknown_format": "3"},
+            "execution_count": 2,
+            "metadata": {},
+            "output_type": "execute_result",
+        },
+        {
+            "data": {
+                "unknown_data_type": "**Lorep** _ipsum_\n",
+            },
+            "metadata": {},
+            "output_type": "display_data",
+        },
+    ],
+    ids=["execute_result", "display_data"],
+)
+def test_render_unknown_data_format(
+    unknown_output: Dict[str, Any], rich_notebook_output: RichOutput
+) -> None:
+    """It skips rendering results and displays of unknown formats."""
+    output_cell = {
         "cell_type": "code",
         "execution_count": 2,
-        "id": "declared-stevens",
+        "id": "intense-middle",
         "metadata": {},
-        "outputs": [
-            {
-                "data": {
-                    "unknown_data_type": "**Lorep** _ipsum_\n",
-                },
-                "metadata": {},
-                "output_type": "display_data",
-            }
-        ],
+        "outputs": [unknown_output],
         "source": "",
     }
     expected_output = (
@@ -3213,11 +2225,13 @@ def test_render_unknown_display_data(rich_notebook_output: RichOutput) -> None:
         "────────────────────────────────────────"
         "────────────────╯\n"
     )
-    output = rich_notebook_output(unknown_display_data_cell)
+    output = rich_notebook_output(output_cell)
     assert output == expected_output
 
 
-def test_render_json_output(rich_notebook_output: RichOutput) -> None:
+def test_render_json_output(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a JSON output."""
     json_output_cell = {
         "cell_type": "code",
@@ -3237,39 +2251,13 @@ def test_render_json_output(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[1]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[1]:\x1b[0m  "
-        "\x1b[38;2;137;221;255;49m{\x1b[0m\x1b[38;2;255;83"
-        ';112;49m"one"\x1b[0m\x1b[38;2;137;221;255;49m:'
-        "\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;24"
-        "7;140;108;49m1\x1b[0m\x1b[38;2;137;221;255;49m"
-        ",\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;2"
-        '55;83;112;49m"three"\x1b[0m\x1b[38;2;137;221;2'
-        "55;49m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b["
-        "38;2;137;221;255;49m{\x1b[0m\x1b[38;2;255;83;1"
-        '12;49m"a"\x1b[0m\x1b[38;2;137;221;255;49m:\x1b[0m'
-        "\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;195;23"
-        '2;141;49m"b"\x1b[0m\x1b[38;2;137;221;255;49m},'
-        "\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;25"
-        '5;83;112;49m"two"\x1b[0m\x1b[38;2;137;221;255;'
-        "49m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;"
-        "2;247;140;108;49m2\x1b[0m\x1b[38;2;137;221;255"
-        ";49m}\x1b[0m                               "
-        "  \n"
-    )
     output = rich_notebook_output(json_output_cell)
     assert output == expected_output
 
 
-def test_render_latex_output(rich_notebook_output: RichOutput) -> None:
+def test_render_latex_output(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders LaTeX output."""
     latex_output_cell = {
         "cell_type": "code",
@@ -3291,40 +2279,13 @@ def test_render_latex_output(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "      ╭─────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[15]:\x1b[0m │                 "
-        "                                        "
-        "               │\n      ╰────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n                     "
-        "                                        "
-        "                   \n                    "
-        "                                        "
-        "                    \n           α∼Normal"
-        "                                        "
-        "                     \n           β∼Norma"
-        "l                                       "
-        "                      \n           ϵ∼Half"
-        "-Cauchy                                 "
-        "                       \n           μ = α"
-        " + Xβ                                   "
-        "                        \n           y ∼N"
-        "ormal(μ, ϵ)                             "
-        "                         \n              "
-        "                                        "
-        "                          \n             "
-        "                                        "
-        "                           \n"
-    )
     output = rich_notebook_output(latex_output_cell)
     assert expected_output == output
 
 
-def test_render_invalid_latex_output(rich_notebook_output: RichOutput) -> None:
+def test_render_invalid_latex_output(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders invalid LaTeX output."""
     latex_output_cell = {
         "cell_type": "code",
@@ -3339,111 +2300,30 @@ def test_render_invalid_latex_output(rich_notebook_output: RichOutput) -> None:
                 "metadata": {},
                 "output_type": "display_data",
             }
-        ],
-        "source": "",
-    }
-    expected_output = (
-        "      ╭─────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[15]:\x1b[0m │                 "
-        "                                        "
-        "               │\n      ╰────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n       garbledmess   "
-        "                                        "
-        "                   \n"
-    )
-    output = rich_notebook_output(latex_output_cell)
-    assert expected_output == output
-
-
-def test_render_latex_output_no_unicode(rich_notebook_output: RichOutput) -> None:
-    """It does not render LaTeX output if unicode is False."""
-    latex_output_cell = {
-        "cell_type": "code",
-        "execution_count": 15,
-        "id": "sapphire-harmony",
-        "metadata": {},
-        "outputs": [
-            {
-                "data": {
-                    "text/latex": "$$\n\\alpha \\sim \\text{Normal}"
-                    " \\\\\n\\beta \\sim \\text{Normal} \\\\\n\\epsilon"
-                    " \\sim \\text{Half-Cauchy} \\\\\n\\mu = \\alpha +"
-                    " X\\beta \\\\\ny \\sim \\text{Normal}(\\mu, \\epsilon)\n$$\n",
-                    "text/plain": "<IPython.core.display.Latex object>",
-                },
-                "metadata": {},
-                "output_type": "display_data",
-            }
-        ],
-        "source": "",
-    }
-    expected_output = (
-        "      ╭─────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[15]:\x1b[0m │                 "
-        "                                        "
-        "               │\n      ╰────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n       <IPython.core."
-        "display.Latex object>                   "
-        "                   \n"
-    )
-    output = rich_notebook_output(latex_output_cell, unicode=False)
-    assert expected_output == output
-
-
-def test_render_text_display_data(rich_notebook_output: RichOutput) -> None:
-    """It renders text display data."""
-    text_display_data_cell = {
-        "cell_type": "code",
-        "execution_count": 2,
-        "id": "declared-stevens",
-        "metadata": {},
-        "outputs": [
-            {
-                "data": {
-                    "text/plain": "Lorep ipsum",
-                },
-                "metadata": {},
-                "output_type": "display_data",
-            }
-        ],
-        "source": "",
-    }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      Lorep ipsum    "
-        "                                        "
-        "                   \n"
-    )
-    output = rich_notebook_output(text_display_data_cell)
-    assert output == expected_output
+        ],
+        "source": "",
+    }
+    output = rich_notebook_output(latex_output_cell)
+    assert expected_output == output
 
 
-def test_pdf_emoji_output(rich_notebook_output: RichOutput) -> None:
-    """It renders an emoji for PDF output."""
-    pdf_output_cell = {
+def test_render_latex_output_no_unicode(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
+    """It does not render LaTeX output if unicode is False."""
+    latex_output_cell = {
         "cell_type": "code",
-        "execution_count": 2,
-        "id": "declared-stevens",
+        "execution_count": 15,
+        "id": "sapphire-harmony",
         "metadata": {},
         "outputs": [
             {
                 "data": {
-                    "application/pdf": "",
+                    "text/latex": "$$\n\\alpha \\sim \\text{Normal}"
+                    " \\\\\n\\beta \\sim \\text{Normal} \\\\\n\\epsilon"
+                    " \\sim \\text{Half-Cauchy} \\\\\n\\mu = \\alpha +"
+                    " X\\beta \\\\\ny \\sim \\text{Normal}(\\mu, \\epsilon)\n$$\n",
+                    "text/plain": "<IPython.core.display.Latex object>",
                 },
                 "metadata": {},
                 "output_type": "display_data",
@@ -3451,26 +2331,15 @@ def test_pdf_emoji_output(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      📄              "
-        "                                        "
-        "                  \n"
-    )
-    output = rich_notebook_output(pdf_output_cell, unicode=True)
-    assert output == expected_output
+    output = rich_notebook_output(latex_output_cell, unicode=False)
+    assert expected_output == output
 
 
-def test_pdf_nerd_output(rich_notebook_output: RichOutput) -> None:
-    """It renders a nerd font icon for PDF output."""
-    pdf_output_cell = {
+def test_render_text_display_data(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
+    """It renders text display data."""
+    text_display_data_cell = {
         "cell_type": "code",
         "execution_count": 2,
         "id": "declared-stevens",
@@ -3478,7 +2347,7 @@ def test_pdf_nerd_output(rich_notebook_output: RichOutput) -> None:
         "outputs": [
             {
                 "data": {
-                    "application/pdf": "",
+                    "text/plain": "Lorep ipsum",
                 },
                 "metadata": {},
                 "output_type": "display_data",
@@ -3486,25 +2355,40 @@ def test_pdf_nerd_output(rich_notebook_output: RichOutput) -> None:
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \uf1c1              "
-        "                                        "
-        "                   \n"
-    )
-    output = rich_notebook_output(pdf_output_cell, nerd_font=True)
+    output = rich_notebook_output(text_display_data_cell)
     assert output == expected_output
 
 
-def test_pdf_no_unicode_no_nerd(rich_notebook_output: RichOutput) -> None:
-    """It does not render a PDF icon if no nerd font or unicode."""
+@pytest.mark.parametrize(
+    "unicode, nerd_font, icon_output",
+    [
+        (
+            True,
+            False,
+            "                                        "
+            "                                        "
+            "\n      📄                                "
+            "                                        \n",
+        ),
+        (
+            None,
+            True,
+            "                                        "
+            "                                        "
+            "\n      \uf1c1                                 "
+            "                                        \n",
+        ),
+        (False, False, ""),
+    ],
+    ids=["emoji", "nerd_font", "no_unicode_no_nerd"],
+)
+def test_pdf_output(
+    unicode: Optional[bool],
+    nerd_font: bool,
+    icon_output: str,
+    rich_notebook_output: RichOutput,
+) -> None:
+    """It renders an icon for PDF output when the terminal supports one."""
     pdf_output_cell = {
         "cell_type": "code",
         "execution_count": 2,
@@ -3529,8 +2413,8 @@ def test_pdf_no_unicode_no_nerd(rich_notebook_output: RichOutput) -> None:
         "               │\n     ╰─────────────────"
         "────────────────────────────────────────"
         "────────────────╯\n"
-    )
-    output = rich_notebook_output(pdf_output_cell, nerd_font=False, unicode=False)
+    ) + icon_output
+    output = rich_notebook_output(pdf_output_cell, unicode=unicode, nerd_font=nerd_font)
     assert output == expected_output
 
 
@@ -3538,7 +2422,7 @@ def test_vega_output(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a hyperlink to a rendered Vega plot."""
     vega_output_cell = {
@@ -3649,21 +2533,6 @@ def test_vega_output(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=16281369"
-        f"58.012196-350876;file://{tempfile_path}0.html\x1b\\\x1b[94m\uf080"
-        " Click to v"
-        "iew Vega chart\x1b[0m\x1b]8;;\x1b\\               "
-        "                                 \n"
-    )
     output = rich_notebook_output(
         vega_output_cell,
         nerd_font=True,
@@ -3671,14 +2540,14 @@ def test_vega_output(
         hyperlinks=True,
         hide_hyperlink_hints=False,
     )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_invalid_vega_output(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a hyperlink to an invalid Vega plot."""
     vega_output_cell = {
@@ -3698,21 +2567,6 @@ def test_invalid_vega_output(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=16281369"
-        f"58.012196-350876;file://{tempfile_path}0.html\x1b\\\x1b[94m\uf080"
-        " Click to v"
-        "iew Vega chart\x1b[0m\x1b]8;;\x1b\\               "
-        "                                 \n"
-    )
     output = rich_notebook_output(
         vega_output_cell,
         nerd_font=True,
@@ -3720,7 +2574,7 @@ def test_invalid_vega_output(
         hyperlinks=True,
         hide_hyperlink_hints=False,
     )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_vegalite_output(
@@ -3943,7 +2797,7 @@ def test_vegalite_output_no_nerd_font_no_unicode(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a hyperlink to plot without nerd fonts or unicode."""
     vegalite_output_cell = {
@@ -3984,24 +2838,6 @@ def test_vegalite_output_no_nerd_font_no_unicode(
         "source": "",
     }
 
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[4]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=16281372"
-        f"55.127551-234092;file://{tempfile_path}0.html\x1b\\\x1b[94mClick to vie"
-        "w Vega chart\x1b[0m\x1b]8;;\x1b\\                 "
-        "                                 \n"
-        "                                                              "
-        "                  \n      \x1b[38;2;187;134;252mImage         "
-        "                                                            "
-        "\x1b[0m\n"
-    )
     output = rich_notebook_output(
         vegalite_output_cell,
         nerd_font=False,
@@ -4010,7 +2846,7 @@ def test_vegalite_output_no_nerd_font_no_unicode(
         hide_hyperlink_hints=False,
         unicode=False,
     )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_vegalite_output_no_files(
@@ -4153,7 +2989,7 @@ def test_vega_no_icon_no_message(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders subject text when no icons or messages are used."""
     vegalite_output_cell = {
@@ -4194,25 +3030,6 @@ def test_vega_no_icon_no_message(
         "source": "",
     }
 
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[4]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=16281373"
-        f"35.10625-550844;file://{tempfile_path}0.html\x1b\\\x1b[94mVega"
-        " chart\x1b[0"
-        "m\x1b]8;;\x1b\\                                "
-        "                                \n"
-        "                                                              "
-        "                  \n      \x1b[38;2;187;134;252mImage         "
-        "                                                            "
-        "\x1b[0m\n"
-    )
     output = rich_notebook_output(
         vegalite_output_cell,
         nerd_font=False,
@@ -4221,7 +3038,7 @@ def test_vega_no_icon_no_message(
         hide_hyperlink_hints=True,
         unicode=False,
     )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_vega_no_hyperlink(
@@ -4401,6 +3218,7 @@ def test_vega_url(
 def test_vega_url_request_error(
     rich_notebook_output: RichOutput,
     mocker: MockerFixture,
+    expected_output: str,
 ) -> None:
     """It falls back to rendering a message if there is a RequestError."""
     mocker.patch("httpx.get", side_effect=httpx.RequestError("Mock"))
@@ -4421,23 +3239,6 @@ def test_vega_url_request_error(
         ],
         "source": "",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      Vega chart     "
-        "                                        "
-        "                   \n"
-        "                                                              "
-        "                  \n      \x1b[38;2;187;134;252mImage         "
-        "                                                            "
-        "\x1b[0m\n"
-    )
     output = rich_notebook_output(
         vegalite_output_cell,
         nerd_font=False,
@@ -4453,7 +3254,7 @@ def test_render_html(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders HTML output."""
     html_cell = {
@@ -4477,34 +3278,15 @@ def test_render_html(
         "source": "",
     }
 
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[7]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=16281375"
-        f"06.111208-917276;file://{tempfile_path}0.html\x1b\\\x1b[94m🌐 Click to v"
-        "iew HTML\x1b[0m\x1b]8;;\x1b\\                     "
-        "                                \n       "
-        "                                        "
-        "                                 \n      "
-        "\x1b[1mLorep\x1b[0m \x1b[3mIpsum\x1b[0m             "
-        "                                        "
-        "          \n"
-    )
     output = rich_notebook_output(html_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_html_table(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders an HTML table."""
     html_cell = {
@@ -4543,40 +3325,8 @@ def test_render_html_table(
         "source": "",
     }
 
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[7]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n      \x1b]8;id=58222;fi"
-        f"le://{tempfile_path}0.ht"
-        "ml\x1b\\\x1b[94m🌐 Click to view HTML\x1b[0m\x1b]8;;\x1b\\"
-        "                                        "
-        "             \n                          "
-        "                                        "
-        "              \n                         "
-        "                                        "
-        "               \n       \x1b[1mCompany\x1b[0m  "
-        "                \x1b[1mContact\x1b[0m         "
-        "         \x1b[1mCountry\x1b[0m                "
-        "\n      ─────────────────────────────────"
-        "────────────────────────────────────────"
-        "─\n       Alfreds Futterkiste      Maria "
-        "Anders             Germany              "
-        "  \n       Centro comercial         Franc"
-        "isco Chang          Mexico              "
-        "   \n       Moctezuma                    "
-        "                                        "
-        "    \n                                   "
-        "                                        "
-        "     \n"
-    )
     output = rich_notebook_output(html_cell)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_unknown_data_type(rich_notebook_output: RichOutput) -> None:
@@ -4764,7 +3514,7 @@ def test_render_invalid_block_image(
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
     disable_capture: ContextManager[_PluggyPlugin],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a fallback when image is invalid."""
     image_cell = {
@@ -4793,31 +3543,7 @@ def test_render_invalid_block_image(
 
     with disable_capture:
         output = rich_notebook_output(image_cell, images=True, image_drawing="block")
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[1]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[1]:\x1b[0m  "
-        "<AxesSubplot:>                          "
-        "                                  \n     "
-        "                                        "
-        "                                   \n    "
-        f"  \x1b]8;id=45753;file://{tempfile_path}0.png"
-        "\x1b\\\x1b[94m🖼 Click to view"
-        " Image\x1b[0m\x1b]8;;\x1b\\                       "
-        "                              \n         "
-        "                                        "
-        "                               \n      \x1b["
-        "38;2;187;134;252m<Figure size 432x288 wi"
-        "th 1 Axes>                              "
-        "           \x1b[0m\n"
-    )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_height_constrained_block_image(
@@ -4990,8 +3716,8 @@ def test_render_image_link(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
     disable_capture: ContextManager[_PluggyPlugin],
+    expected_output: str,
 ) -> None:
     """It renders a link to an image."""
     image_cell = {
@@ -5133,30 +3859,7 @@ def test_render_image_link(
 
     with disable_capture:
         output = rich_notebook_output(image_cell, images=False)
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[1]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[1]:\x1b[0m  "
-        "<AxesSubplot:>                          "
-        "                                  \n     "
-        "                                        "
-        "                                   \n    "
-        f"  \x1b]8;id=42532;file://{tempfile_path}0.png"
-        "\x1b\\\x1b[94m🖼 Click to view"
-        " Image\x1b[0m\x1b]8;;\x1b\\                       "
-        "                              \n         "
-        "                                        "
-        "                               \n      <F"
-        "igure size 432x288 with 1 Axes>         "
-        "                                \n"
-    )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_charater_drawing(
@@ -5461,6 +4164,7 @@ def test_invalid_image_drawing(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
+    expected_output: str,
 ) -> None:
     """It fallsback to text when failing to draw image."""
     image_cell = {
@@ -5489,28 +4193,6 @@ def test_invalid_image_drawing(
     output = rich_notebook_output(
         image_cell, images=True, image_drawing="character", files=False
     )
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[1]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[1]:\x1b[0m  "
-        "<AxesSubplot:>                          "
-        "                                  \n     "
-        "                                        "
-        "                                   \n    "
-        "  🖼 Image                               "
-        "                                    \n   "
-        "                                        "
-        "                                     \n  "
-        "    \x1b[38;2;187;134;252m<Figure size 432x"
-        "288 with 1 Axes>                        "
-        "                 \x1b[0m\n"
-    )
     assert output == expected_output
 
 
@@ -5518,8 +4200,8 @@ def test_render_image_link_no_image(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
     disable_capture: ContextManager[_PluggyPlugin],
+    expected_output: str,
 ) -> None:
     """It renders a link to an image."""
     image_cell = {
@@ -5661,37 +4343,14 @@ def test_render_image_link_no_image(
 
     with disable_capture:
         output = rich_notebook_output(image_cell, images=False)
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[1]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[1]:\x1b[0m  "
-        "<AxesSubplot:>                          "
-        "                                  \n     "
-        "                                        "
-        "                                   \n    "
-        f"  \x1b]8;id=236660;file://{tempfile_path}0.png"
-        "\x1b\\\x1b[94m🖼 Click to vie"
-        "w Image\x1b[0m\x1b]8;;\x1b\\                      "
-        "                               \n        "
-        "                                        "
-        "                                \n      <"
-        "Figure size 432x288 with 1 Axes>        "
-        "                                 \n"
-    )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_render_svg_link(
     rich_notebook_output: RichOutput,
     mock_tempfile_file: Generator[Mock, None, None],
     remove_link_ids: Callable[[str], str],
-    tempfile_path: Path,
+    expected_output: str,
 ) -> None:
     """It renders a link to an image."""
     svg_cell = {
@@ -5749,27 +4408,7 @@ def test_render_svg_link(
     }
     output = rich_notebook_output(svg_cell)
 
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │                  "
-        "                                        "
-        "               │\n     ╰─────────────────"
-        "────────────────────────────────────────"
-        "────────────────╯\n                      "
-        "                                        "
-        "                  \n\x1b[38;5;247m[2]:\x1b[0m  "
-        f"\x1b]8;id=1627259094.976956-618609;file://{tempfile_path}0.svg"
-        "\x1b\\\x1b[9"
-        "4m🖼 Click to view Image\x1b[0m\x1b]8;;\x1b\\      "
-        "                                        "
-        "       \n                                "
-        "                                        "
-        "        \n\x1b[38;5;247m[2]:\x1b[0m  <graphviz."
-        "dot.Digraph at 0x108eb9430>             "
-        "                        \n"
-    )
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_unknown_language() -> None:
@@ -5867,7 +4506,9 @@ def test_relative_dir_markdown_link(
     assert remove_link_ids(output) == remove_link_ids(expected_output)
 
 
-def test_notebook_code_line_numbers(rich_notebook_output: RichOutput) -> None:
+def test_notebook_code_line_numbers(
+    rich_notebook_output: RichOutput, expected_output: str
+) -> None:
     """It renders a code cell with line numbers."""
     code_cell = {
         "cell_type": "code",
@@ -5878,41 +4519,12 @@ def test_notebook_code_line_numbers(rich_notebook_output: RichOutput) -> None:
         "source": "def foo(x: float, y: float) -> float:\n    return x + y",
     }
     output = rich_notebook_output(code_cell, line_numbers=True)
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[2]:\x1b[0m │   \x1b[2m1 \x1b[0m\x1b[38;"
-        "2;187;128;179;49mdef\x1b[0m\x1b[38;2;238;255;2"
-        "55;49m \x1b[0m\x1b[38;2;130;170;255;49mfoo\x1b[0m"
-        "\x1b[38;2;137;221;255;49m(\x1b[0m\x1b[38;2;238;25"
-        "5;255;49mx\x1b[0m\x1b[38;2;137;221;255;49m:\x1b[0"
-        "m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;130;1"
-        "70;255;49mfloat\x1b[0m\x1b[38;2;137;221;255;49"
-        "m,\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;"
-        "238;255;255;49my\x1b[0m\x1b[38;2;137;221;255;4"
-        "9m:\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2"
-        ";130;170;255;49mfloat\x1b[0m\x1b[38;2;137;221;"
-        "255;49m)\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;137;221;255;49m-\x1b[0m\x1b[38;2;137;221"
-        ";255;49m>\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m"
-        "\x1b[38;2;130;170;255;49mfloat\x1b[0m\x1b[38;2;13"
-        "7;221;255;49m:\x1b[0m                      "
-        "         │\n     │   \x1b[2m2 \x1b[0m\x1b[38;2;238"
-        ";255;255;49m    \x1b[0m\x1b[38;2;187;128;179;4"
-        "9mreturn\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;238;255;255;49mx\x1b[0m\x1b[38;2;238;255"
-        ";255;49m \x1b[0m\x1b[38;2;137;221;255;49m+\x1b[0m"
-        "\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;238;25"
-        "5;255;49my\x1b[0m                          "
-        "                          │\n     ╰──────"
-        "────────────────────────────────────────"
-        "───────────────────────────╯\n"
-    )
     assert output == expected_output
 
 
 def test_notebook_line_numbers_magic_code_cell(
     rich_notebook_output: RichOutput,
+    expected_output: str,
 ) -> None:
     """It renders line numbers in a code cell with language magic."""
     code_cell = {
@@ -5923,26 +4535,11 @@ def test_notebook_line_numbers_magic_code_cell(
         "outputs": [],
         "source": "%%bash\necho 'lorep'",
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │   \x1b[2m1 \x1b[0m\x1b[38;"
-        "2;137;221;255;49m%%\x1b[0m\x1b[38;2;187;128;17"
-        "9;49mbash\x1b[0m                           "
-        "                                   │\n   "
-        "  │   \x1b[2m2 \x1b[0m\x1b[38;2;130;170;255;49mec"
-        "ho\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;"
-        "195;232;141;49m'lorep'\x1b[0m              "
-        "                                        "
-        "  │\n     ╰──────────────────────────────"
-        "────────────────────────────────────────"
-        "───╯\n"
-    )
     output = rich_notebook_output(code_cell, line_numbers=True)
     assert output == expected_output
 
 
-def test_code_wrap(rich_notebook_output: RichOutput) -> None:
+def test_code_wrap(rich_notebook_output: RichOutput, expected_output: str) -> None:
     """It wraps code when narrow."""
     code_cell = {
         "cell_type": "code",
@@ -5953,37 +4550,6 @@ def test_code_wrap(rich_notebook_output: RichOutput) -> None:
         "source": "non_monkeys ="
         ' [animal for animal in get_animals("mamals") if animal != "monkey"]',
     }
-    expected_output = (
-        "     ╭──────────────────────────────────"
-        "───────────────────────────────────────╮"
-        "\n\x1b[38;5;247m[3]:\x1b[0m │ \x1b[38;2;238;255;25"
-        "5;49mnon_monkeys\x1b[0m\x1b[38;2;238;255;255;4"
-        "9m \x1b[0m\x1b[38;2;137;221;255;49m=\x1b[0m\x1b[38;2"
-        ";238;255;255;49m \x1b[0m\x1b[38;2;137;221;255;"
-        "49m[\x1b[0m\x1b[38;2;238;255;255;49manimal\x1b[0m"
-        "\x1b[38;2;238;255;255;49m \x1b[0m\x1b[38;2;187;12"
-        "8;179;49mfor\x1b[0m\x1b[38;2;238;255;255;49m \x1b"
-        "[0m\x1b[38;2;238;255;255;49manimal\x1b[0m\x1b[38;"
-        "2;238;255;255;49m \x1b[0m\x1b[3;38;2;137;221;2"
-        "55;49min\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b"
-        "[38;2;238;255;255;49mget_animals\x1b[0m\x1b[38"
-        ";2;137;221;255;49m(\x1b[0m\x1b[38;2;195;232;14"
-        '1;49m"\x1b[0m\x1b[38;2;195;232;141;49mmamals\x1b['
-        '0m\x1b[38;2;195;232;141;49m"\x1b[0m\x1b[38;2;137;'
-        "221;255;49m)\x1b[0m\x1b[38;2;238;255;255;49m \x1b"
-        "[0m\x1b[38;2;187;128;179;49mif\x1b[0m\x1b[38;2;23"
-        "8;255;255;49m \x1b[0m\x1b[38;2;238;255;255;49m"
-        "animal\x1b[0m\x1b[38;2;238;255;255;49m \x1b[0m\x1b[3"
-        "8;2;137;221;255;49m!=\x1b[0m\x1b[38;2;238;255;"
-        "255;49m \x1b[0m │\n     │ \x1b[38;2;195;232;141"
-        ';49m"\x1b[0m\x1b[38;2;195;232;141;49mmonkey\x1b[0'
-        'm\x1b[38;2;195;232;141;49m"\x1b[0m\x1b[38;2;137;2'
-        "21;255;49m]\x1b[0m                         "
-        "                                      │\n"
-        "     ╰──────────────────────────────────"
-        "───────────────────────────────────────╯"
-        "\n"
-    )
     output = rich_notebook_output(code_cell, code_wrap=True)
     assert output == expected_output
 
@@ -6000,7 +4566,7 @@ def test_html_encoded_image_link_text(
     )
     nbpreview_notebook = notebook.Notebook.from_file(notebook_path)
     output = rich_console(nbpreview_notebook, False)
-    assert remove_link_ids(output) == remove_link_ids(expected_output)
+    assert remove_link_ids(output) == expected_output
 
 
 def test_long_path(